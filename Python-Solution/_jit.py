@@ -0,0 +1,143 @@
+"""Numba-compiled search cores for RiverCrossingSolver.
+
+The transition graph is passed in CSR form: the successors of state ``s`` are
+``succs[offsets[s]:offsets[s + 1]]``. Every core returns the parent table
+(-1 for states without a parent) and the states in the order the search
+recorded them; the last recorded state is the goal when a solution exists.
+"""
+import numpy as np
+from numba import njit
+
+N_STATES = 1 << 9
+
+
+@njit(cache=True)
+def bfs_core(offsets, succs, initial, goal):
+    """Breadth-First Search over a fixed-size queue."""
+    parents = np.full(N_STATES, -1, dtype=np.int16)
+    visited = np.zeros(N_STATES, dtype=np.uint8)
+    order = np.empty(N_STATES, dtype=np.int16)
+    queue = np.empty(N_STATES, dtype=np.int16)
+    head = 0
+    tail = 1
+    queue[0] = initial
+    visited[initial] = 1
+    order[0] = initial
+    count = 1
+    if initial == goal:
+        return parents, order[:count]
+
+    while head < tail:
+        state = queue[head]
+        head += 1
+
+        for k in range(offsets[state], offsets[state + 1]):
+            new_state = succs[k]
+            if not visited[new_state]:
+                visited[new_state] = 1
+                parents[new_state] = state
+                order[count] = new_state
+                count += 1
+                if new_state == goal:
+                    return parents, order[:count]
+                queue[tail] = new_state
+                tail += 1
+
+    return parents, order[:count]
+
+
+@njit(cache=True)
+def dfs_core(offsets, succs, initial, goal):
+    """Depth-First Search over a fixed-size stack."""
+    parents = np.full(N_STATES, -1, dtype=np.int16)
+    visited = np.zeros(N_STATES, dtype=np.uint8)
+    order = np.empty(N_STATES, dtype=np.int16)
+    # Every visited state pushes each successor at most once
+    stack = np.empty(len(succs) + 1, dtype=np.int16)
+    count = 0
+    top = 1
+    stack[0] = initial
+
+    while top > 0:
+        top -= 1
+        state = stack[top]
+
+        if visited[state]:
+            continue
+
+        visited[state] = 1
+        order[count] = state
+        count += 1
+
+        if state == goal:
+            break
+
+        # Push children in reverse order to maintain left-to-right exploration
+        for k in range(offsets[state + 1] - 1, offsets[state] - 1, -1):
+            new_state = succs[k]
+            if not visited[new_state]:
+                parents[new_state] = state
+                stack[top] = new_state
+                top += 1
+
+    return parents, order[:count]
+
+
+@njit(cache=True)
+def dls_core(offsets, succs, initial, goal, limit):
+    """Depth-Limited Search; each stack frame resumes at its next successor."""
+    parents = np.full(N_STATES, -1, dtype=np.int16)
+    visited = np.zeros(N_STATES, dtype=np.uint8)
+    order = np.empty(N_STATES, dtype=np.int16)
+    # Most remaining depth each state has been entered with, -1 if never.
+    # Re-entering a state reached with more depth left keeps the search complete.
+    best_limit = np.full(N_STATES, -1, dtype=np.int32)
+    # A state is only re-entered with more depth than any frame of it on the
+    # stack, so frames hold distinct states and never exceed N_STATES
+    frame_state = np.empty(N_STATES, dtype=np.int16)
+    frame_limit = np.empty(N_STATES, dtype=np.int32)
+    frame_next = np.empty(N_STATES, dtype=np.int32)
+    count = 0
+    depth = 0
+    state = initial
+    best_limit[state] = limit
+
+    while True:
+        if state == goal:
+            order[count] = state
+            count += 1
+            break
+
+        if limit > 0:
+            if not visited[state]:
+                visited[state] = 1
+                order[count] = state
+                count += 1
+            frame_state[depth] = state
+            frame_limit[depth] = limit
+            frame_next[depth] = offsets[state]
+            depth += 1
+
+        # Resume the deepest state with a successor worth (re-)entering
+        resumed = False
+        while depth > 0:
+            parent = frame_state[depth - 1]
+            k = frame_next[depth - 1]
+            end = offsets[parent + 1]
+            child_limit = frame_limit[depth - 1] - 1
+            while k < end and best_limit[succs[k]] >= child_limit:
+                k += 1
+            if k < end:
+                frame_next[depth - 1] = k + 1
+                state = succs[k]
+                parents[state] = parent
+                limit = child_limit
+                best_limit[state] = limit
+                resumed = True
+                break
+            depth -= 1
+
+        if not resumed:
+            break
+
+    return parents, order[:count]
@@ -0,0 +1,160 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Cython search cores for RiverCrossingSolver.
+
+These follow the same contract as the Numba cores in ``_jit.py``: the
+transition graph is passed in CSR form, and every core returns the parent
+table (-1 for states without a parent) and the states in the order the
+search recorded them, both as ``array.array('h')``.
+
+Build in place with ``python setup.py build_ext --inplace``.
+"""
+import array
+
+from libc.string cimport memset
+
+cdef enum:
+    N_STATES = 1 << 9
+
+
+def bfs_core(const int[::1] offsets, const short[::1] succs, int initial, int goal):
+    """Breadth-First Search over a fixed-size queue."""
+    parents = array.array('h', [-1]) * N_STATES
+    order = array.array('h', [0]) * N_STATES
+    cdef short[::1] parent_of = parents
+    cdef short[::1] recorded = order
+    cdef unsigned char visited[N_STATES]
+    cdef short queue[N_STATES]
+    cdef Py_ssize_t head = 0, tail = 1, count = 1, k
+    cdef int state, new_state
+
+    memset(visited, 0, N_STATES)
+    queue[0] = initial
+    visited[initial] = 1
+    recorded[0] = initial
+    if initial == goal:
+        return parents, order[:count]
+
+    while head < tail:
+        state = queue[head]
+        head += 1
+
+        for k in range(offsets[state], offsets[state + 1]):
+            new_state = succs[k]
+            if not visited[new_state]:
+                visited[new_state] = 1
+                parent_of[new_state] = state
+                recorded[count] = new_state
+                count += 1
+                if new_state == goal:
+                    return parents, order[:count]
+                queue[tail] = new_state
+                tail += 1
+
+    return parents, order[:count]
+
+
+def dfs_core(const int[::1] offsets, const short[::1] succs, int initial, int goal):
+    """Depth-First Search over a fixed-size stack."""
+    parents = array.array('h', [-1]) * N_STATES
+    order = array.array('h', [0]) * N_STATES
+    # Every visited state pushes each successor at most once
+    pending = array.array('h', [0]) * (succs.shape[0] + 1)
+    cdef short[::1] parent_of = parents
+    cdef short[::1] recorded = order
+    cdef short[::1] stack = pending
+    cdef unsigned char visited[N_STATES]
+    cdef Py_ssize_t top = 1, count = 0, k
+    cdef int state, new_state
+
+    memset(visited, 0, N_STATES)
+    stack[0] = initial
+
+    while top > 0:
+        top -= 1
+        state = stack[top]
+
+        if visited[state]:
+            continue
+
+        visited[state] = 1
+        recorded[count] = state
+        count += 1
+
+        if state == goal:
+            break
+
+        # Push children in reverse order to maintain left-to-right exploration
+        for k in range(offsets[state + 1] - 1, offsets[state] - 1, -1):
+            new_state = succs[k]
+            if not visited[new_state]:
+                parent_of[new_state] = state
+                stack[top] = new_state
+                top += 1
+
+    return parents, order[:count]
+
+
+def dls_core(const int[::1] offsets, const short[::1] succs, int initial, int goal,
+             int limit):
+    """Depth-Limited Search; each stack frame resumes at its next successor."""
+    parents = array.array('h', [-1]) * N_STATES
+    order = array.array('h', [0]) * N_STATES
+    cdef short[::1] parent_of = parents
+    cdef short[::1] recorded = order
+    cdef unsigned char visited[N_STATES]
+    # Most remaining depth each state has been entered with, -1 if never.
+    # Re-entering a state reached with more depth left keeps the search complete.
+    cdef int best_limit[N_STATES]
+    # A state is only re-entered with more depth than any frame of it on the
+    # stack, so frames hold distinct states and never exceed N_STATES
+    cdef short frame_state[N_STATES]
+    cdef int frame_limit[N_STATES]
+    cdef int frame_next[N_STATES]
+    cdef Py_ssize_t depth = 0, count = 0
+    cdef int state = initial, parent, k, end, child_limit
+    cdef bint resumed
+
+    memset(visited, 0, N_STATES)
+    for k in range(N_STATES):
+        best_limit[k] = -1
+    best_limit[state] = limit
+
+    while True:
+        if state == goal:
+            recorded[count] = state
+            count += 1
+            break
+
+        if limit > 0:
+            if not visited[state]:
+                visited[state] = 1
+                recorded[count] = state
+                count += 1
+            frame_state[depth] = state
+            frame_limit[depth] = limit
+            frame_next[depth] = offsets[state]
+            depth += 1
+
+        # Resume the deepest state with a successor worth (re-)entering
+        resumed = False
+        while depth > 0:
+            parent = frame_state[depth - 1]
+            k = frame_next[depth - 1]
+            end = offsets[parent + 1]
+            child_limit = frame_limit[depth - 1] - 1
+            while k < end and best_limit[succs[k]] >= child_limit:
+                k += 1
+            if k < end:
+                frame_next[depth - 1] = k + 1
+                state = succs[k]
+                parent_of[state] = parent
+                limit = child_limit
+                best_limit[state] = limit
+                resumed = True
+                break
+            depth -= 1
+
+        if not resumed:
+            break
+
+    return parents, order[:count]
@@ -1,209 +1,526 @@
+import array
+import copy
+import functools
+import inspect
 import tkinter as tk
 from tkinter import ttk, messagebox
-from collections import deque, namedtuple
-from typing import List, Dict, Set, Tuple, Optional
+from collections import namedtuple
+from typing import List, Dict, Tuple, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the opt-in level-wise BFS needs it
+    np = None
+
+try:
+    from _solver import bfs_core, dfs_core, dls_core
+except ImportError:  # Cython extension not built; try the Numba cores
+    try:
+        from _jit import bfs_core, dfs_core, dls_core
+    except ImportError:  # NumPy/Numba are optional; fall back to pure Python
+        bfs_core = dfs_core = dls_core = None
+
+
+def _memoized(algorithm: str):
+    """Cache a solver method's successful result per (algorithm, arguments)."""
+    def decorator(search):
+        signature = inspect.signature(search)
+        
+        @functools.wraps(search)
+        def wrapper(self, *args, **kwargs):
+            # Bind with defaults so solve_dls() and solve_dls(limit=20) share a key
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (algorithm,) + tuple(bound.arguments.values())[1:]
+            cached = self._solve_cache.get(key)
+            if cached is not None:
+                self.reset()
+                for name, value in cached.items():
+                    setattr(self, name, copy.copy(value))
+                return True
+            
+            found = search(*bound.args, **bound.kwargs)
+            if found:
+                self._solve_cache[key] = {name: copy.copy(getattr(self, name))
+                                          for name in self._CACHED_FIELDS}
+            return found
+        return wrapper
+    return decorator
+
 
 class RiverCrossingSolver:
     """Solves the river crossing puzzle with multiple constraints using BFS, DFS, or DLS."""
     
     ROLES = ["Police", "Father", "Mom", "Thief", 
              "Son1", "Son2", "Daughter1", "Daughter2"]
-    OPERATORS = {0, 1, 2}  # Indices of Police, Father, Mom
     State = namedtuple('State', ['police', 'father', 'mom', 'thief', 
                                'son1', 'son2', 'daughter1', 'daughter2', 'boat'])
 
+    # Role bit masks. A state is a 9-bit integer: bit i holds the side of
+    # ROLES[i] and bit 8 the side of the boat (0 = left bank, 1 = right bank).
+    POLICE = 1 << 0
+    FATHER = 1 << 1
+    MOM = 1 << 2
+    THIEF = 1 << 3
+    SON1 = 1 << 4
+    SON2 = 1 << 5
+    DAUGHTER1 = 1 << 6
+    DAUGHTER2 = 1 << 7
+    BOAT = 1 << 8
+    SONS = SON1 | SON2
+    DAUGHTERS = DAUGHTER1 | DAUGHTER2
+    EVERYONE = 0xFF
+    OPERATOR_MASK = POLICE | FATHER | MOM
+    ROLE_BIT = {role: 1 << i for i, role in enumerate(ROLES)}
+
+    N_STATES = 1 << 9
+    INITIAL_STATE = 0       # All on left bank, boat on left
+    GOAL_STATE = 0x1FF      # All on right bank, boat on right
+
+    # XOR mask for every (operator, passenger) pair; the diagonal entry is the
+    # operator crossing alone.
+    _MOVE_MASKS = tuple(
+        tuple((1 << op_idx) | (1 << passenger_idx) | (1 << 8)
+              for passenger_idx in range(8))
+        for op_idx in range(8)
+    )
+
+    # Move generators per boat side, compiled below the class body
+    _moves_left = _moves_right = None
+    # _is_bank_safe result for every 8-bit bank, filled in below the class body
+    _SAFE = bytes(256)
+    # Valid successors of every state, filled in below the class body
+    _ADJ: Tuple[Tuple[int, ...], ...] = ()
+    # The same table in CSR form for the compiled search cores
+    _OFFSETS = array.array('i')
+    _SUCCS = array.array('h')
+    # Opt in to the NumPy level-wise BFS; on this 512-state graph the per-level
+    # array calls cost more than the plain queue loop saves
+    VECTORIZED_BFS = False
+
+    # Solver results saved and restored by ``_memoized``
+    _CACHED_FIELDS = ("visited", "parents", "solution_path", "move_labels",
+                      "all_states", "max_depth")
+
     def __init__(self):
-        self.reset()
+        self.reset(hard=True)
 
-    def reset(self):
-        """Reset solver state."""
-        self.visited = set()
-        self.parents = {}
+    def reset(self, hard: bool = False):
+        """Reset solver state; ``hard`` also drops the cached solutions."""
+        if hard:
+            self._solve_cache = {}
+        self.visited = 0  # Bitmap: bit s is set once state s is visited
+        self.parents = self._new_parent_table()
         self.solution_path = []
-        self.all_states = []
+        self.move_labels = []  # Entry i describes solution_path[i] -> [i + 1]
+        self.all_states = array.array('H')  # States in the order they were first visited
         self.max_depth = 0
         self.current_animation = None
 
-    def is_goal(self, state: str) -> bool:
+    @classmethod
+    def _new_parent_table(cls) -> array.array:
+        """Parent of every state, -1 where none has been recorded."""
+        return array.array('h', [-1]) * cls.N_STATES
+
+    def is_goal(self, state: int) -> bool:
         """Check if all have crossed to the right bank."""
-        return all(side == 'R' for side in state[:-1])
+        return state == self.GOAL_STATE
 
-    def is_valid(self, state: str) -> bool:
+    @classmethod
+    def is_valid(cls, state: int) -> bool:
         """Validate constraints for a given state."""
-        left_bank = {role for role, side in zip(self.ROLES, state) if side == 'L'}
-        right_bank = {role for role, side in zip(self.ROLES, state) if side == 'R'}
-        
-        return (self._is_bank_safe(left_bank) and self._is_bank_safe(right_bank))
+        return bool(cls._SAFE[~state & cls.EVERYONE] & cls._SAFE[state & cls.EVERYONE])
 
-    def _is_bank_safe(self, bank: Set[str]) -> bool:
-        """Check safety constraints for one bank."""
-        has_police = 'Police' in bank
-        has_father = 'Father' in bank
-        has_mother = 'Mom' in bank
-        
+    @classmethod
+    def _is_bank_safe(cls, bank: int) -> bool:
+        """Check safety constraints for one bank, given as a role bitmask."""
         # Thief cannot be with others without police
-        if 'Thief' in bank and not has_police and len(bank) > 1:
+        if bank & cls.THIEF and not bank & cls.POLICE and bank & ~cls.THIEF:
             return False
             
         # Father cannot be with daughters without mother
-        if has_father and not has_mother:
-            if any(d in bank for d in ['Daughter1', 'Daughter2']):
-                return False
+        if bank & cls.FATHER and not bank & cls.MOM and bank & cls.DAUGHTERS:
+            return False
                 
         # Mother cannot be with sons without father
-        if has_mother and not has_father:
-            if any(s in bank for s in ['Son1', 'Son2']):
-                return False
+        if bank & cls.MOM and not bank & cls.FATHER and bank & cls.SONS:
+            return False
                 
         return True
 
-    def get_valid_moves(self, state: str) -> List[Tuple[int, Optional[int]]]:
+    @classmethod
+    def get_valid_moves(cls, state: int) -> List[Tuple[int, Optional[int]]]:
         """Generate all possible valid moves from current state."""
-        moves = []
-        boat_side = state[-1]
-        operator_indices = [i for i in self.OPERATORS if state[i] == boat_side]
-        
-        # Single-person crossings (only operators)
-        for op_idx in operator_indices:
-            moves.append((op_idx, None))
-        
-        # Two-person crossings (operator + any)
-        for i, op_idx in enumerate(operator_indices):
-            for passenger_idx in range(len(state)-1):
-                if passenger_idx != op_idx and state[passenger_idx] == boat_side:
-                    moves.append((op_idx, passenger_idx))
-        
-        return moves
+        if state & cls.BOAT:
+            return cls._moves_right(state)
+        return cls._moves_left(state)
+
+    @classmethod
+    def _compile_move_generators(cls):
+        """Generate unrolled ``get_valid_moves`` bodies for each boat side."""
+        # Operator indices from the low set bits of OPERATOR_MASK
+        operators = []
+        ops = cls.OPERATOR_MASK
+        while ops:
+            low = ops & -ops
+            operators.append(low.bit_length() - 1)
+            ops ^= low
+        
+        # Each body masks the state once, then tests one bit per crossing in the
+        # generic order: single crossings first, then operator with passenger
+        generators = []
+        for name, bank in (("_moves_left", f"~state & {cls.EVERYONE}"),
+                           ("_moves_right", f"state & {cls.EVERYONE}")):
+            lines = [f"def {name}(state):",
+                     "    moves = []",
+                     f"    here = {bank}  # Roles on the boat's bank",
+                     f"    ops = here & {cls.OPERATOR_MASK}",
+                     "    if not ops:",
+                     "        return moves"]
+            
+            # Single-person crossings (only operators)
+            for op_idx in operators:
+                lines.append(f"    if ops & {1 << op_idx}:")
+                lines.append(f"        moves.append(({op_idx}, None))")
+            
+            # Two-person crossings (operator + any)
+            for op_idx in operators:
+                lines.append(f"    if ops & {1 << op_idx}:")
+                for passenger_idx in range(len(cls.ROLES)):
+                    if passenger_idx != op_idx:
+                        lines.append(f"        if here & {1 << passenger_idx}:")
+                        lines.append(f"            moves.append(({op_idx}, {passenger_idx}))")
+            
+            lines.append("    return moves")
+            namespace = {}
+            exec(compile("\n".join(lines), f"<{cls.__name__}.{name}>", "exec"), namespace)
+            generators.append(staticmethod(namespace[name]))
+        return tuple(generators)
 
-    def apply_move(self, state: str, move: Tuple[int, Optional[int]]) -> str:
+    @classmethod
+    def apply_move(cls, state: int, move: Tuple[int, Optional[int]]) -> int:
         """Apply a move to the current state."""
         op_idx, passenger_idx = move
-        new_state = list(state)
-        boat_side = new_state[-1]
-        
-        # Switch sides for the operator
-        new_state[op_idx] = 'R' if boat_side == 'L' else 'L'
+        if passenger_idx is None:
+            passenger_idx = op_idx
         
-        # Switch side for passenger if exists
-        if passenger_idx is not None:
-            new_state[passenger_idx] = 'R' if boat_side == 'L' else 'L'
-        
-        # Switch boat side
-        new_state[-1] = 'R' if boat_side == 'L' else 'L'
+        # Switch sides for the operator, the passenger and the boat
+        return state ^ cls._MOVE_MASKS[op_idx][passenger_idx]
+
+    @classmethod
+    def _build_adjacency(cls) -> Tuple[Tuple[int, ...], ...]:
+        """Build the successor table for all 512 states."""
+        # Successors keep get_valid_moves order; invalid states get none
+        table = []
+        for state in range(cls.N_STATES):
+            successors = []
+            if cls.is_valid(state):
+                for move in cls.get_valid_moves(state):
+                    new_state = cls.apply_move(state, move)
+                    if cls.is_valid(new_state):
+                        successors.append(new_state)
+            table.append(tuple(successors))
+        return tuple(table)
+
+    @classmethod
+    def _build_csr(cls) -> Tuple[array.array, array.array]:
+        """Flatten ``_ADJ`` into CSR offset and successor arrays."""
+        offsets = array.array('i', [0])
+        succs = array.array('h')
+        for successors in cls._ADJ:
+            succs.extend(successors)
+            offsets.append(len(succs))
+        return offsets, succs
+
+    def _load_core_result(self, parents, order) -> bool:
+        """Adopt the parent table and state order returned by a compiled core."""
+        # Cores return int16 buffers, so one bytes copy replaces a per-element one;
+        # the Cython cores already hand back an array('h') that can be kept as is
+        if isinstance(parents, array.array):
+            self.parents = parents
+        else:
+            self.parents = array.array('h', parents.tobytes())
+        self.all_states = array.array('H', order.tobytes())
         
-        return ''.join(new_state)
+        if self.all_states and self.is_goal(self.all_states[-1]):
+            self._reconstruct_path(self.all_states[-1])
+            return True
+        return False
 
+    @_memoized("BFS")
     def solve_bfs(self) -> bool:
         """Find solution using Breadth-First Search."""
         self.reset()
-        queue = deque()
-        initial_state = 'L' * 9  # All on left bank, boat on left
-        queue.append(initial_state)
-        self.visited.add(initial_state)
+        initial_state = self.INITIAL_STATE
+        if bfs_core is not None:
+            return self._load_core_result(*bfs_core(
+                self._OFFSETS, self._SUCCS, initial_state, self.GOAL_STATE))
+        if self.VECTORIZED_BFS and np is not None:
+            return self._load_core_result(*self._bfs_levels(initial_state))
+        
+        # Every state is enqueued at most once, so a fixed buffer never fills
+        queue = [0] * self.N_STATES
+        queue[0] = initial_state
+        head, tail = 0, 1
+        self.visited |= 1 << initial_state
+        self.all_states.append(initial_state)
+        if self.is_goal(initial_state):
+            self._reconstruct_path(initial_state)
+            return True
         
-        while queue:
-            current_state = queue.popleft()
-            self.all_states.append(current_state)
-            
-            if self.is_goal(current_state):
-                self._reconstruct_path(current_state)
-                return True
+        while head < tail:
+            current_state = queue[head]
+            head += 1
             
-            for move in self.get_valid_moves(current_state):
-                new_state = self.apply_move(current_state, move)
-                
-                if new_state not in self.visited and self.is_valid(new_state):
-                    self.visited.add(new_state)
+            for new_state in self._ADJ[current_state]:
+                if not (self.visited >> new_state) & 1:
+                    self.visited |= 1 << new_state
+                    self.all_states.append(new_state)
                     self.parents[new_state] = current_state
-                    queue.append(new_state)
+                    
+                    # The first path to reach a state is a shortest one
+                    if self.is_goal(new_state):
+                        self._reconstruct_path(new_state)
+                        return True
+                    queue[tail] = new_state
+                    tail += 1
         
         return False
 
+    def _bfs_levels(self, initial_state: int):
+        """Level-synchronous BFS that expands a whole frontier per NumPy call."""
+        # Parents and discovery order match the queue loop in solve_bfs
+        offsets = np.frombuffer(self._OFFSETS, dtype=np.intc)
+        succs = np.frombuffer(self._SUCCS, dtype=np.int16)
+        parents = np.full(self.N_STATES, -1, dtype=np.int16)
+        visited = np.zeros(self.N_STATES, dtype=np.bool_)
+        visited[initial_state] = True
+        frontier = np.array([initial_state], dtype=np.int16)
+        levels = []
+        
+        while frontier.size:
+            goal_hits = np.flatnonzero(frontier == self.GOAL_STATE)
+            if goal_hits.size:
+                levels.append(frontier[:goal_hits[0] + 1])
+                break
+            levels.append(frontier)
+            
+            # Gather every outgoing edge of the frontier, node by node
+            starts = offsets[frontier]
+            degrees = offsets[frontier + 1] - starts
+            edge_starts = starts - (np.cumsum(degrees) - degrees)
+            edges = np.repeat(edge_starts, degrees) + np.arange(degrees.sum())
+            sources = np.repeat(frontier, degrees)
+            neighbors = succs[edges]
+            
+            fresh = ~visited[neighbors]
+            neighbors, sources = neighbors[fresh], sources[fresh]
+            
+            # Keep the first edge into each new state, in discovery order
+            _, first = np.unique(neighbors, return_index=True)
+            first.sort()
+            frontier = neighbors[first]
+            visited[frontier] = True
+            parents[frontier] = sources[first]
+        
+        return parents, np.concatenate(levels)
+
+    @_memoized("Bidirectional BFS")
+    def solve_bidirectional_bfs(self) -> bool:
+        """Find solution using BFS from both banks until the searches meet."""
+        self.reset()
+        initial_state = self.INITIAL_STATE
+        goal_state = self.GOAL_STATE
+        forward = [initial_state]
+        backward = [goal_state]
+        forward_visited = 1 << initial_state
+        backward_visited = 1 << goal_state
+        backward_parents = self._new_parent_table()  # Next state towards the goal
+        meeting = initial_state if initial_state == goal_state else None
+        # States each search first visited, so the two orders stay separate
+        forward_states = [initial_state]
+        backward_states = [] if meeting is not None else [goal_state]
+        
+        # Moves are reversible, so the backward search walks the same _ADJ table.
+        # Expanding the smaller frontier a full level at a time keeps the
+        # spliced path as short as plain BFS.
+        while meeting is None and forward and backward:
+            if len(forward) <= len(backward):
+                forward, forward_visited, meeting = self._expand_level(
+                    forward, forward_visited, self.parents, backward_visited,
+                    forward_states)
+            else:
+                backward, backward_visited, meeting = self._expand_level(
+                    backward, backward_visited, backward_parents, forward_visited,
+                    backward_states)
+        
+        # Backward states go last, nearest the goal at the end
+        self.all_states = array.array('H', forward_states + backward_states[::-1])
+        self.visited = forward_visited | backward_visited
+        if meeting is None:
+            return False
+        
+        # Forward half from the parent links, then walk on towards the goal
+        self._reconstruct_path(meeting)
+        path = self.solution_path
+        current = meeting
+        while backward_parents[current] != -1:
+            current = backward_parents[current]
+            path.append(current)
+        self._set_solution_path(path)
+        return True
+
+    def _expand_level(self, frontier: List[int], visited: int, parents: array.array,
+                      other_visited: int,
+                      explored: List[int]) -> Tuple[List[int], int, Optional[int]]:
+        """Expand one BFS level for ``solve_bidirectional_bfs``."""
+        # Returns the next frontier, the updated bitmap and the meeting state or None
+        next_frontier = []
+        for state in frontier:
+            for new_state in self._ADJ[state]:
+                if not (visited >> new_state) & 1:
+                    visited |= 1 << new_state
+                    parents[new_state] = state
+                    if (other_visited >> new_state) & 1:
+                        return next_frontier, visited, new_state
+                    explored.append(new_state)
+                    next_frontier.append(new_state)
+        
+        return next_frontier, visited, None
+
+    @_memoized("DFS")
     def solve_dfs(self) -> bool:
         """Find solution using Depth-First Search."""
         self.reset()
+        initial_state = self.INITIAL_STATE
+        if dfs_core is not None:
+            return self._load_core_result(*dfs_core(
+                self._OFFSETS, self._SUCCS, initial_state, self.GOAL_STATE))
+        
         stack = []
-        initial_state = 'L' * 9
         stack.append(initial_state)
         
         while stack:
             current_state = stack.pop()
             
-            if current_state in self.visited:
+            if (self.visited >> current_state) & 1:
                 continue
                 
-            self.visited.add(current_state)
+            self.visited |= 1 << current_state
             self.all_states.append(current_state)
             
             if self.is_goal(current_state):
                 self._reconstruct_path(current_state)
                 return True
                 
-            # Generate children in reverse order to maintain left-to-right exploration
-            moves = self.get_valid_moves(current_state)
-            for move in reversed(moves):
-                new_state = self.apply_move(current_state, move)
-                if new_state not in self.visited and self.is_valid(new_state):
+            # Push children in reverse order to maintain left-to-right exploration
+            for new_state in reversed(self._ADJ[current_state]):
+                if not (self.visited >> new_state) & 1:
                     self.parents[new_state] = current_state
                     stack.append(new_state)
         
         return False
 
+    @_memoized("DLS")
     def solve_dls(self, limit: int = 20) -> bool:
-        """Find solution using Depth-Limited Search."""
+        """Find solution using iterative-deepening Depth-Limited Search."""
         self.reset()
-        initial_state = 'L' * 9
-        self.max_depth = 0
-        return self._dls_helper(initial_state, limit)
+        initial_state = self.INITIAL_STATE
+        # The first limit that succeeds gives a shortest path; max_depth keeps
+        # the last limit tried
+        for depth in range(1, limit + 1):
+            self.reset()
+            self.max_depth = depth
+            if dls_core is not None:
+                parents, order = dls_core(
+                    self._OFFSETS, self._SUCCS, initial_state, self.GOAL_STATE, depth)
+                # Only the successful or final round is copied into the solver
+                found = len(order) > 0 and self.is_goal(order[-1])
+                if found or depth == limit:
+                    self._load_core_result(parents, order)
+            else:
+                found = self._dls_helper(initial_state, depth)
+            if found:
+                return True
+        return False
 
-    def _dls_helper(self, state: str, limit: int) -> bool:
-        """Recursive helper for DLS."""
-        if self.is_goal(state):
-            self.all_states.append(state)
-            self._reconstruct_path(state)
-            return True
+    def _dls_helper(self, state: int, limit: int) -> bool:
+        """Iterative helper for DLS using an explicit stack of successor iterators."""
+        # Most remaining depth each state has been entered with, -1 if never.
+        # Re-entering a state reached with more depth left keeps the round complete.
+        best_limit = array.array('i', [-1]) * self.N_STATES
+        best_limit[state] = limit
+        stack = []
+        
+        while True:
+            if self.is_goal(state):
+                self.all_states.append(state)
+                self._reconstruct_path(state)
+                return True
             
-        if limit <= 0:
-            return False
+            if limit > 0:
+                if not (self.visited >> state) & 1:
+                    self.visited |= 1 << state
+                    self.all_states.append(state)
+                stack.append((state, limit, iter(self._ADJ[state])))
             
-        self.visited.add(state)
-        self.all_states.append(state)
-        
-        for move in self.get_valid_moves(state):
-            new_state = self.apply_move(state, move)
+            # Resume the deepest state with a successor worth (re-)entering
+            while stack:
+                parent, parent_limit, successors = stack[-1]
+                for state in successors:
+                    if best_limit[state] < parent_limit - 1:
+                        break
+                else:
+                    stack.pop()
+                    continue
+                break
+            else:
+                return False
             
-            if new_state not in self.visited and self.is_valid(new_state):
-                self.parents[new_state] = state
-                if self._dls_helper(new_state, limit - 1):
-                    return True
-                
-        return False
+            self.parents[state] = parent
+            limit = parent_limit - 1
+            best_limit[state] = limit
 
-    def _reconstruct_path(self, goal_state: str) -> None:
+    def _reconstruct_path(self, goal_state: int) -> None:
         """Reconstruct path from goal to initial state."""
         path = []
         current = goal_state
         
-        while current in self.parents:
+        # Only the initial state keeps the -1 sentinel
+        while self.parents[current] != -1:
             path.append(current)
             current = self.parents[current]
         
         path.append(current)  # Add initial state
-        self.solution_path = path[::-1]  # Reverse to get from start to goal
+        self._set_solution_path(path[::-1])  # Reverse to get from start to goal
+
+    def _set_solution_path(self, path: List[int]) -> None:
+        """Store a solution path along with the label of each of its moves."""
+        self.solution_path = path
+        self.move_labels = [self.describe_move(from_state, to_state)
+                            for from_state, to_state in zip(path, path[1:])]
+
+    @classmethod
+    def describe_move(cls, from_state: int, to_state: int) -> str:
+        """Describe who crosses between two states and in which direction."""
+        changed = from_state ^ to_state
+        moving = [role for role, bit in cls.ROLE_BIT.items() if changed & bit]
+        boat_dir = "➡️" if not from_state & cls.BOAT else "⬅️"
+        return f"Moving: {', '.join(moving)} {boat_dir}"
 
-    def visualize_state(self, state: str) -> Tuple[List[str], List[str]]:
-        """Convert state string to left/right bank lists."""
-        left = [role for role, side in zip(self.ROLES, state) if side == 'L']
-        right = [role for role, side in zip(self.ROLES, state) if side == 'R']
+    def visualize_state(self, state: int) -> Tuple[List[str], List[str]]:
+        """Convert state bitmask to left/right bank lists."""
+        left = [role for role, bit in self.ROLE_BIT.items() if not state & bit]
+        right = [role for role, bit in self.ROLE_BIT.items() if state & bit]
         return left, right
 
-    def reset(self):
-        """Reset solver state."""
-        self.visited = set()
-        self.parents = {}
-        self.solution_path = []
-        self.all_states = []
-        self.max_depth = 0
+
+RiverCrossingSolver._SAFE = bytes(RiverCrossingSolver._is_bank_safe(bank)
+                                  for bank in range(RiverCrossingSolver.EVERYONE + 1))
+RiverCrossingSolver._moves_left, RiverCrossingSolver._moves_right = (
+    RiverCrossingSolver._compile_move_generators())
+RiverCrossingSolver._ADJ = RiverCrossingSolver._build_adjacency()
+RiverCrossingSolver._OFFSETS, RiverCrossingSolver._SUCCS = RiverCrossingSolver._build_csr()
 
 
 class RiverCrossingGUI:
@@ -219,7 +536,10 @@ class RiverCrossingGUI:
         self.current_step = 0
         self.total_steps = 0
         self.path_to_show = []
+        self.path_labels = None
         self.transition_state = None
+        self.animation_phase = "settled"  # "transition" while a move is shown
+        self.after_id = None
         
         self._setup_ui()
         
@@ -249,9 +569,9 @@ class RiverCrossingGUI:
         self.algorithm_menu = ttk.Combobox(
             master=self.algorithm_frame,
             textvariable=self.algorithm_var,
-            values=["BFS", "DFS", "DLS"],
+            values=["BFS", "Bidirectional BFS", "DFS", "DLS"],
             state="readonly",
-            width=10
+            width=16
         )
         self.algorithm_menu.pack(side=tk.LEFT, padx=5)
         
@@ -286,7 +606,8 @@ class RiverCrossingGUI:
         self.solution_button = tk.Button(
             master=self.control_frame, 
             text="Show Solution", 
-            command=lambda: self.show_path(self.solver.solution_path),
+            command=lambda: self.show_path(self.solver.solution_path,
+                                           self.solver.move_labels),
             width=15,
             state=tk.DISABLED
         )
@@ -400,6 +721,38 @@ class RiverCrossingGUI:
             borderwidth=2
         )
         
+        # Bank and river labels, created once and reused for every frame
+        self.left_title_label = tk.Label(
+            master=self.left_bank_frame,
+            text="Left Bank",
+            font=("Arial", 12, "bold"),
+            bg="lightgreen"
+        )
+        self.right_title_label = tk.Label(
+            master=self.right_bank_frame,
+            text="Right Bank",
+            font=("Arial", 12, "bold"),
+            bg="lightgreen"
+        )
+        self.left_role_labels = [
+            tk.Label(master=self.left_bank_frame, font=("Arial", 12), bg="lightgreen")
+            for _ in self.solver.ROLES
+        ]
+        self.right_role_labels = [
+            tk.Label(master=self.right_bank_frame, font=("Arial", 12), bg="lightgreen")
+            for _ in self.solver.ROLES
+        ]
+        self.boat_label = tk.Label(
+            master=self.river_frame,
+            font=("Arial", 14),
+            bg="lightblue"
+        )
+        self.transition_label = tk.Label(
+            master=self.river_frame,
+            font=("Arial", 14, "bold"),
+            bg="lightblue"
+        )
+        
         # Pack frames
         self.left_bank_frame.pack(fill=tk.Y, side=tk.LEFT)
         self.river_frame.pack(fill=tk.Y, side=tk.LEFT)
@@ -436,6 +789,8 @@ class RiverCrossingGUI:
         try:
             if algorithm == "BFS":
                 success = self.solver.solve_bfs()
+            elif algorithm == "Bidirectional BFS":
+                success = self.solver.solve_bidirectional_bfs()
             elif algorithm == "DFS":
                 success = self.solver.solve_dfs()
             elif algorithm == "DLS":
@@ -456,14 +811,16 @@ class RiverCrossingGUI:
         else:
             messagebox.showinfo("No Solution", "No solution found with current parameters")
     
-    def show_path(self, path: List[str]):
+    def show_path(self, path: List[int], move_labels: Optional[List[str]] = None):
         """Prepare to show a path (solution or all moves)."""
         if not path:
             messagebox.showwarning("No Path", "No path to display!")
             return
             
         self.path_to_show = path
+        self.path_labels = move_labels  # None: describe each transition when shown
         self.current_step = 0
+        self.animation_phase = "settled"
         self.total_steps = len(path)
         self.steps_label.config(text=f"Step: 0/{self.total_steps}")
         
@@ -477,13 +834,14 @@ class RiverCrossingGUI:
             return
             
         self.animation_running = True
-        self._animate_next_step()
+        self._advance()
     
     def stop_animation(self):
         """Stop the current animation."""
         self.animation_running = False
-        if hasattr(self, 'after_id'):
+        if self.after_id is not None:
             self.window.after_cancel(self.after_id)
+            self.after_id = None
     
     def reset_animation(self):
         """Reset the animation to initial state."""
@@ -491,74 +849,72 @@ class RiverCrossingGUI:
         self.current_step = 0
         self.total_steps = 0
         self.path_to_show = []
+        self.path_labels = None
         self.transition_state = None
+        self.animation_phase = "settled"
         self._clear_visualization()
         self.status_label.config(text="Ready to solve...")
         self.steps_label.config(text="Step: 0/0")
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.DISABLED)
     
-    def _animate_next_step(self):
-        """Animate the next step in the path."""
-        if not self.animation_running or self.current_step >= self.total_steps - 1:
-            self.animation_running = False
+    def _advance(self):
+        """Move the animation one phase forward on a single pending timer."""
+        # A settled step first shows the transition into the next step, which
+        # settles on that step's state half a delay later
+        self.after_id = None
+        if not self.animation_running:
             return
-            
-        # Calculate delay based on speed (2000ms base delay for 1.0 speed)
-        base_delay = 2000  # 2 seconds at speed 1.0
-        delay = int(base_delay / self.speed_var.get())
-        
-        # First show transition (half the time)
-        self.current_step += 1
-        self._show_transition_state(self.path_to_show[self.current_step-1], 
-                                  self.path_to_show[self.current_step])
         
-        # Then show the final state after half delay
-        self.after_id = self.window.after(delay // 2, lambda: 
+        if self.animation_phase == "transition":
             self._update_visualization(
                 self.path_to_show[self.current_step],
                 self.current_step,
                 self.total_steps
             )
-        )
+            self.animation_phase = "settled"
+        elif self.current_step < self.total_steps - 1:
+            self.current_step += 1
+            self._show_transition_state(self.path_to_show[self.current_step-1], 
+                                      self.path_to_show[self.current_step])
+            self.animation_phase = "transition"
+        
+        if self.animation_phase == "settled" and self.current_step >= self.total_steps - 1:
+            self.animation_running = False
+            return
         
-        # Schedule next step
-        self.after_id = self.window.after(delay, self._animate_next_step)
+        # Calculate delay based on speed (2000ms base delay for 1.0 speed);
+        # each phase takes half of it
+        base_delay = 2000  # 2 seconds at speed 1.0
+        delay = int(base_delay / self.speed_var.get())
+        self.after_id = self.window.after(delay // 2, self._advance)
     
-    def _show_transition_state(self, from_state: str, to_state: str):
+    def _show_transition_state(self, from_state: int, to_state: int):
         """Show the transition between two states."""
         self.transition_state = (from_state, to_state)
         
         # Highlight who is moving
-        moving = []
-        for i in range(len(from_state)-1):
-            if from_state[i] != to_state[i]:
-                moving.append(self.solver.ROLES[i])
-        
-        boat_dir = "➡️" if from_state[-1] == 'L' else "⬅️"
-        transition_text = f"Moving: {', '.join(moving)} {boat_dir}"
+        if self.path_labels:
+            transition_text = self.path_labels[self.current_step - 1]
+        else:
+            transition_text = self.solver.describe_move(from_state, to_state)
         
         self._clear_visualization()
         
         # Show transition message in the river frame
-        transition_label = tk.Label(
-            master=self.river_frame,
-            text=transition_text,
-            font=("Arial", 14, "bold"),
-            bg="lightblue"
-        )
-        transition_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        self.transition_label.config(text=transition_text)
+        self.transition_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
         
         # Update status
         self.status_label.config(text=f"Transition: {transition_text}")
         self.steps_label.config(text=f"Step: {self.current_step}/{self.total_steps}")
     
-    def _update_visualization(self, state: str, step: int, total_steps: int):
+    def _update_visualization(self, state: int, step: int, total_steps: int):
         """Update the visualization for a given state."""
         self._clear_visualization()
         
         left_bank, right_bank = self.solver.visualize_state(state)
-        boat_side = "left" if state[-1] == 'L' else "right"
+        boat_side = "right" if state & self.solver.BOAT else "left"
         
         # Update status
         self.status_label.config(
@@ -566,56 +922,29 @@ class RiverCrossingGUI:
         )
         
         # Display left bank
-        left_label = tk.Label(
-            master=self.left_bank_frame,
-            text="Left Bank",
-            font=("Arial", 12, "bold"),
-            bg="lightgreen"
-        )
-        left_label.pack(pady=5)
-        
-        for role in left_bank:
-            label = tk.Label(
-                master=self.left_bank_frame,
-                text=role,
-                font=("Arial", 12),
-                bg="lightgreen"
-            )
+        self.left_title_label.pack(pady=5)
+        for label, role in zip(self.left_role_labels, left_bank):
+            label.config(text=role)
             label.pack(pady=2)
         
         # Display right bank
-        right_label = tk.Label(
-            master=self.right_bank_frame,
-            text="Right Bank",
-            font=("Arial", 12, "bold"),
-            bg="lightgreen"
-        )
-        right_label.pack(pady=5)
-        
-        for role in right_bank:
-            label = tk.Label(
-                master=self.right_bank_frame,
-                text=role,
-                font=("Arial", 12),
-                bg="lightgreen"
-            )
+        self.right_title_label.pack(pady=5)
+        for label, role in zip(self.right_role_labels, right_bank):
+            label.config(text=role)
             label.pack(pady=2)
         
         # Display boat
-        boat_text = "🛶 ➡️" if state[-1] == 'R' else "⬅️ 🛶"
-        boat_label = tk.Label(
-            master=self.river_frame,
-            text=f"{boat_text}\nBoat is on\n{boat_side} side",
-            font=("Arial", 14),
-            bg="lightblue"
-        )
-        boat_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        boat_text = "🛶 ➡️" if state & self.solver.BOAT else "⬅️ 🛶"
+        self.boat_label.config(text=f"{boat_text}\nBoat is on\n{boat_side} side")
+        self.boat_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
     
     def _clear_visualization(self):
-        """Clear all widgets from visualization frames."""
-        for frame in [self.left_bank_frame, self.river_frame, self.right_bank_frame]:
-            for widget in frame.winfo_children():
-                widget.destroy()
+        """Hide all widgets in the visualization frames; they are reused later."""
+        for label in [self.left_title_label, self.right_title_label,
+                      *self.left_role_labels, *self.right_role_labels]:
+            label.pack_forget()
+        self.boat_label.place_forget()
+        self.transition_label.place_forget()
     
     def run(self):
         """Run the main application loop."""
@@ -0,0 +1,8 @@
+"""Build the optional Cython search cores: python setup.py build_ext --inplace"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="river-crossing-puzzle",
+    ext_modules=cythonize("_solver.pyx"),
+)